@@ -1,25 +1,19 @@
-import asyncio
-import json
-import time
 import logging
-import inspect
-import aiohttp
-import uuid
-import async_timeout
-from typing import Dict, Any, List, Union, AsyncGenerator, Tuple, Optional, Callable
-from datetime import datetime
+from typing import Dict, Any, List, AsyncGenerator, Optional
 from .wrapper import LLMClientWrapper
 from .mcp_adapter.client import BBServerMCPClient
 from .mcp_adapter.tools import SimpleTool
-from .messages import HumanMessage, AIMessage, AIMessageChunk
+from .messages import HumanMessage, AIMessageChunk
 
 from openai.types.chat import (
     ChatCompletionMessageParam, ChatCompletionUserMessageParam
 )
 
-import logging 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+# Wrapper events that carry a bare AIMessageChunk and are re-emitted as "messages".
+MESSAGE_CHUNK_TYPES = frozenset({"reasoning_chunk", "tool_output_chunk", "tool_output_chunk_error"})
 
 
 class BBAgentExecutor:
@@ -41,7 +35,7 @@ class BBAgentExecutor:
 
     async def astream(self, input_messages: Dict[str, Any], stream_mode: List[str], config: Dict, debug: bool = False) -> AsyncGenerator:
         user_message_content = ""
-        logger.info(f"PROCESSING INPUT MESSAGE: {input_messages}")
+        logger.debug("PROCESSING INPUT MESSAGE: %s", input_messages)
 
         if "messages" in input_messages and isinstance(input_messages["messages"], list):
             processed_history_for_llm_client: List[ChatCompletionMessageParam] = []
@@ -87,33 +81,22 @@ class BBAgentExecutor:
                 if debug:
                     logger.debug(f"BBAgentExecutor astream emitting: Type={item_type}, Data={data}")
 
-                if item_type == "messages": 
+                # Branches are ordered by frequency: one "chunk" per raw delta, then text "messages".
+                if item_type == "chunk": 
+                    yield ("chunk", data) 
+
+                elif item_type == "messages": 
                     if isinstance(data, tuple) and len(data) > 0 and isinstance(data[0], AIMessageChunk):
                         message_data: AIMessageChunk = data[0]
                         yield ("messages", (message_data, {})) 
                     else:
                         logger.error(f"Invalid message data format for 'messages' chunk_type. Expected (AIMessageChunk, {{}}), got: {data}")
 
-                elif item_type == "reasoning_chunk":
-                    if isinstance(data, AIMessageChunk):
-                        yield ("messages", (data, {})) 
-                    else:
-                        logger.error(f"Invalid message data format for 'reasoning_chunk'. Expected AIMessageChunk, got: {data}")
-
-                elif item_type == "tool_output_chunk": 
+                elif item_type in MESSAGE_CHUNK_TYPES:
                     if isinstance(data, AIMessageChunk):
                         yield ("messages", (data, {}))
                     else:
-                        logger.error(f"Invalid message data format for 'tool_output_chunk'. Expected AIMessageChunk, got: {data}")
-
-                elif item_type == "tool_output_chunk_error":
-                    if isinstance(data, AIMessageChunk):
-                        yield ("messages", (data, {}))
-                    else:
-                        logger.error(f"Invalid message data format for 'tool_output_chunk_error'. Expected AIMessageChunk, got: {data}")
-
-                elif item_type == "chunk": 
-                    yield ("chunk", data) 
+                        logger.error(f"Invalid message data format for '{item_type}'. Expected AIMessageChunk, got: {data}")
 
                 elif item_type == "values": 
                     if "values" in stream_mode: 
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import json
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 from types import TracebackType
 from typing import Any, AsyncIterator, Dict, List, Optional
 
@@ -10,10 +10,11 @@ from ..cache import AbstractLLMCache
 from datetime import datetime, timedelta, timezone
 
 from mcp import ClientSession
+from pydantic import TypeAdapter
 from mcp.types import Tool as MCPTool 
 
 from .prompts import load_mcp_prompt
-from .resources import load_mcp_resources
+from .resources import MAX_CONCURRENT_RESOURCE_READS, load_mcp_resources
 from .sessions import (
     Connection,
     McpHttpClientFactory,
@@ -41,16 +42,28 @@ ASYNC_CONTEXT_MANAGER_ERROR = (
 
 DEFAULT_TOOL_CACHE_EXPIRATION_SECONDS = 300
 
+# Built once: validates a whole cached tool list in a single pydantic-core call.
+MCP_TOOL_LIST_ADAPTER = TypeAdapter(list[MCPTool])
+
 class BBServerMCPClient:
     def __init__(
         self,
         connections: dict[str, Connection] | None = None,
         tool_cache_expiration_seconds: int = DEFAULT_TOOL_CACHE_EXPIRATION_SECONDS,
         cache_adapter: Optional[AbstractLLMCache] = None,
+        max_concurrent_connections: int | None = None,
     ) -> None:
+        if max_concurrent_connections is not None and (
+            not isinstance(max_concurrent_connections, int)
+            or isinstance(max_concurrent_connections, bool)
+            or max_concurrent_connections < 1
+        ):
+            raise ValueError("max_concurrent_connections must be None or an integer >= 1")
+
         self.connections: dict[str, Connection] = connections if connections is not None else {}
         self.tool_cache_expiration_seconds = tool_cache_expiration_seconds
         self.cache_adapter = cache_adapter
+        self.max_concurrent_connections = max_concurrent_connections
         
         self._connection_name_map: Dict[str, Connection] = {name: conn for name, conn in self.connections.items()}
 
@@ -73,22 +86,26 @@ class BBServerMCPClient:
                 await session.initialize()
             yield session
 
-    async def get_tools(self, *, server_name: str | None = None) -> list[SimpleTool]:
+    def _tool_cache_key(self, server_name: str | None) -> str:
+        # Hashed on every call: connections are public and may be edited after init.
         cache_key_prefix = "mcp_tools"
-        
+        if server_name is not None:
+            conn_hash = _get_connection_hash(self.connections[server_name])
+            return f"{cache_key_prefix}:{server_name}:{conn_hash}"
+        all_conns_hash = _get_all_connections_hash(self.connections)
+        return f"{cache_key_prefix}:all_connections:{all_conns_hash}"
+
+    async def get_tools(self, *, server_name: str | None = None) -> list[SimpleTool]:
         if server_name is not None:
             if server_name not in self.connections:
                 raise ValueError(f"Connection '{server_name}' not found in client configuration.")
             
-            conn_config = self.connections[server_name]
-            conn_hash = _get_connection_hash(conn_config)
-            cache_key = f"{cache_key_prefix}:{server_name}:{conn_hash}"
-            connections_to_fetch = {server_name: conn_config}
+            connections_to_fetch = {server_name: self.connections[server_name]}
         else:
-            all_conns_hash = _get_all_connections_hash(self.connections)
-            cache_key = f"{cache_key_prefix}:all_connections:{all_conns_hash}"
             connections_to_fetch = self.connections
 
+        cache_key = self._tool_cache_key(server_name)
+
         cached_mcp_tools_data: Optional[Dict[str, Any]] = None
 
         if self.cache_adapter:
@@ -105,7 +122,7 @@ class BBServerMCPClient:
                                 logger.warning(f"Connection config '{conn_name}' not found for cached tools. Skipping.")
                                 continue
                             
-                            deserialized_mcp_tools = [MCPTool.model_validate(raw) for raw in raw_mcp_tools_list]
+                            deserialized_mcp_tools = MCP_TOOL_LIST_ADAPTER.validate_python(raw_mcp_tools_list)
                             
                             for mcp_tool in deserialized_mcp_tools:
                                 all_deserialized_simple_tools.append(
@@ -124,11 +141,17 @@ class BBServerMCPClient:
         fetched_mcp_tools_by_connection: Dict[str, List[MCPTool]] = {}
         all_simple_tools: List[SimpleTool] = []
 
+        connection_limit = (
+            asyncio.Semaphore(self.max_concurrent_connections)
+            if self.max_concurrent_connections is not None
+            else nullcontext()
+        )
+
         load_mcp_tool_tasks = []
         for conn_name, connection in connections_to_fetch.items():
             logger.info(f"PROCESSING {conn_name} -- {connection}")
             async def _fetch_and_convert(cn: str, conn: Connection):
-                async with self.session(cn) as list_session:
+                async with connection_limit, self.session(cn) as list_session:
                     mcp_tools = await _list_all_tools(list_session)
                     logger.info(f"GET TOOLS {mcp_tools}")
                     fetched_mcp_tools_by_connection[cn] = mcp_tools 
@@ -172,10 +195,14 @@ class BBServerMCPClient:
             return prompt
 
     async def get_resources(
-        self, server_name: str, *, uris: str | list[str] | None = None
+        self,
+        server_name: str,
+        *,
+        uris: str | list[str] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_RESOURCE_READS,
     ) -> list[Any]:
         async with self.session(server_name) as session:
-            resources = await load_mcp_resources(session, uris=uris)
+            resources = await load_mcp_resources(session, uris=uris, max_concurrency=max_concurrency)
             return resources
 
     async def __aenter__(self) -> "BBServerMCPClient":
@@ -5,13 +5,13 @@ from mcp import ClientSession
 from mcp.types import PromptMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class HumanMessage:
     content: str
     role: Literal["user"] = "user"
 
 
-@dataclass
+@dataclass(slots=True)
 class AIMessage:
     content: str
     role: Literal["assistant"] = "assistant"
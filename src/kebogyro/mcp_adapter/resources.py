@@ -1,3 +1,4 @@
+import asyncio
 import base64
 from typing import Any
 from dataclasses import dataclass
@@ -5,6 +6,8 @@ from dataclasses import dataclass
 from mcp import ClientSession
 from mcp.types import BlobResourceContents, ResourceContents, TextResourceContents
 
+MAX_CONCURRENT_RESOURCE_READS = 8
+
 
 @dataclass
 class Blob:
@@ -49,7 +52,15 @@ async def load_mcp_resources(
     session: ClientSession,
     *,
     uris: str | list[str] | None = None,
+    max_concurrency: int = MAX_CONCURRENT_RESOURCE_READS,
 ) -> list[Blob]:
+    if (
+        not isinstance(max_concurrency, int)
+        or isinstance(max_concurrency, bool)
+        or max_concurrency < 1
+    ):
+        raise ValueError("max_concurrency must be an integer >= 1")
+
     blobs = []
 
     if uris is None:
@@ -60,11 +71,36 @@ async def load_mcp_resources(
     else:
         uri_list = uris
 
-    for uri in uri_list:
-        try:
-            resource_blobs = await get_mcp_resource(session, uri)
-            blobs.extend(resource_blobs)
-        except Exception as e:
-            raise RuntimeError(f"Error fetching resource {uri}") from e
+    if not uri_list:
+        return blobs
+
+    read_limit = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch(uri: str) -> list[Blob]:
+        async with read_limit:
+            try:
+                return await get_mcp_resource(session, uri)
+            except Exception as e:
+                raise RuntimeError(f"Error fetching resource {uri}") from e
+
+    tasks = [asyncio.ensure_future(_fetch(uri)) for uri in uri_list]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        # On failure (or cancellation) stop the sibling reads before the caller closes the session.
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        # Retrieve every failure so asyncio doesn't report the extra ones as never retrieved.
+        errors = [task.exception() for task in tasks if not task.cancelled()]
+
+    first_error = next((error for error in errors if error is not None), None)
+    if first_error is not None:
+        raise first_error
+
+    for task in tasks:
+        blobs.extend(task.result())
 
     return blobs
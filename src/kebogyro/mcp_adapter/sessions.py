@@ -4,7 +4,7 @@ import os
 from contextlib import asynccontextmanager
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, AsyncIterator, Literal, Protocol
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Literal, Protocol
 
 import httpx
 from mcp import ClientSession, StdioServerParameters
@@ -88,9 +88,9 @@ async def _create_stdio_session(
     encoding_error_handler: Literal["strict", "ignore", "replace"] = DEFAULT_ENCODING_ERROR_HANDLER,
     session_kwargs: dict[str, Any] | None = None,
 ) -> AsyncIterator[ClientSession]:
-    env = env or {}
-    if "PATH" not in env:
-        env["PATH"] = os.environ.get("PATH", "")
+    if env is None or "PATH" not in env:
+        # Copy rather than mutate: env usually belongs to the caller's connection config.
+        env = {**(env or {}), "PATH": os.environ.get("PATH", "")}
 
     server_params = StdioServerParameters(
         command=command,
@@ -170,6 +170,67 @@ async def _create_websocket_session(
             yield session
 
 
+def _sse_session_from(connection: SSEConnection) -> AsyncContextManager[ClientSession]:
+    if "url" not in connection:
+        raise ValueError("'url' parameter is required for SSE connection")
+    return _create_sse_session(
+        url=connection["url"],
+        headers=connection.get("headers"),
+        timeout=connection.get("timeout", DEFAULT_HTTP_TIMEOUT),
+        sse_read_timeout=connection.get("sse_read_timeout", DEFAULT_SSE_READ_TIMEOUT),
+        session_kwargs=connection.get("session_kwargs"),
+        httpx_client_factory=connection.get("httpx_client_factory"),
+        auth=connection.get("auth"),
+    )
+
+
+def _streamable_http_session_from(connection: StreamableHttpConnection) -> AsyncContextManager[ClientSession]:
+    if "url" not in connection:
+        raise ValueError("'url' parameter is required for Streamable HTTP connection")
+    return _create_streamable_http_session(
+        url=connection["url"],
+        headers=connection.get("headers"),
+        timeout=connection.get("timeout", DEFAULT_STREAMABLE_HTTP_TIMEOUT),
+        sse_read_timeout=connection.get("sse_read_timeout", DEFAULT_STREAMABLE_HTTP_SSE_READ_TIMEOUT),
+        session_kwargs=connection.get("session_kwargs"),
+        httpx_client_factory=connection.get("httpx_client_factory"),
+        auth=connection.get("auth"),
+    )
+
+
+def _stdio_session_from(connection: StdioConnection) -> AsyncContextManager[ClientSession]:
+    if "command" not in connection:
+        raise ValueError("'command' parameter is required for stdio connection")
+    if "args" not in connection:
+        raise ValueError("'args' parameter is required for stdio connection")
+    return _create_stdio_session(
+        command=connection["command"],
+        args=connection["args"],
+        env=connection.get("env"),
+        cwd=connection.get("cwd"),
+        encoding=connection.get("encoding", DEFAULT_ENCODING),
+        encoding_error_handler=connection.get("encoding_error_handler", DEFAULT_ENCODING_ERROR_HANDLER),
+        session_kwargs=connection.get("session_kwargs"),
+    )
+
+
+def _websocket_session_from(connection: WebsocketConnection) -> AsyncContextManager[ClientSession]:
+    if "url" not in connection:
+        raise ValueError("'url' parameter is required for Websocket connection")
+    return _create_websocket_session(
+        url=connection["url"],
+        session_kwargs=connection.get("session_kwargs"),
+    )
+
+
+_SESSION_FACTORIES: dict[str, Callable[[Any], AsyncContextManager[ClientSession]]] = {
+    "sse": _sse_session_from,
+    "streamable_http": _streamable_http_session_from,
+    "stdio": _stdio_session_from,
+    "websocket": _websocket_session_from,
+}
+
+
 @asynccontextmanager
 async def create_session(
     connection: Connection,
@@ -180,56 +241,11 @@ async def create_session(
         )
 
     transport = connection["transport"]
-    if transport == "sse":
-        if "url" not in connection:
-            raise ValueError("'url' parameter is required for SSE connection")
-        async with _create_sse_session(
-            url=connection["url"],
-            headers=connection.get("headers"),
-            timeout=connection.get("timeout", DEFAULT_HTTP_TIMEOUT),
-            sse_read_timeout=connection.get("sse_read_timeout", DEFAULT_SSE_READ_TIMEOUT),
-            session_kwargs=connection.get("session_kwargs"),
-            httpx_client_factory=connection.get("httpx_client_factory"),
-            auth=connection.get("auth"),
-        ) as session:
-            yield session
-    elif transport == "streamable_http":
-        if "url" not in connection:
-            raise ValueError("'url' parameter is required for Streamable HTTP connection")
-        async with _create_streamable_http_session(
-            url=connection["url"],
-            headers=connection.get("headers"),
-            timeout=connection.get("timeout", DEFAULT_STREAMABLE_HTTP_TIMEOUT),
-            sse_read_timeout=connection.get("sse_read_timeout", DEFAULT_STREAMABLE_HTTP_SSE_READ_TIMEOUT),
-            session_kwargs=connection.get("session_kwargs"),
-            httpx_client_factory=connection.get("httpx_client_factory"),
-            auth=connection.get("auth"),
-        ) as session:
-            yield session
-    elif transport == "stdio":
-        if "command" not in connection:
-            raise ValueError("'command' parameter is required for stdio connection")
-        if "args" not in connection:
-            raise ValueError("'args' parameter is required for stdio connection")
-        async with _create_stdio_session(
-            command=connection["command"],
-            args=connection["args"],
-            env=connection.get("env"),
-            cwd=connection.get("cwd"),
-            encoding=connection.get("encoding", DEFAULT_ENCODING),
-            encoding_error_handler=connection.get("encoding_error_handler", DEFAULT_ENCODING_ERROR_HANDLER),
-            session_kwargs=connection.get("session_kwargs"),
-        ) as session:
-            yield session
-    elif transport == "websocket":
-        if "url" not in connection:
-            raise ValueError("'url' parameter is required for Websocket connection")
-        async with _create_websocket_session(
-            url=connection["url"],
-            session_kwargs=connection.get("session_kwargs"),
-        ) as session:
-            yield session
-    else:
+    session_factory = _SESSION_FACTORIES.get(transport)
+    if session_factory is None:
         raise ValueError(
             f"Unsupported transport: {transport}. Must be one of: 'stdio', 'sse', 'websocket', 'streamable_http'"
         )
+
+    async with session_factory(connection) as session:
+        yield session
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, cast
 from pydantic import BaseModel, create_model
 import inspect
@@ -72,6 +73,7 @@ class SimpleTool:
         self.args_schema = args_schema
         self.coroutine = coroutine
         self.metadata = metadata or {}
+        self._json_schema: dict[str, Any] | None = None
 
     @classmethod
     def from_fn(cls, name: str, description: str, fn: callable, metadata: dict = None):
@@ -84,19 +86,35 @@ class SimpleTool:
         ArgsModel = create_model(f"{name.title()}Args", **fields)
         return cls(name, description, ArgsModel, coroutine=fn, metadata=metadata)
 
+    def json_schema(self) -> dict[str, Any]:
+        """Return the JSON schema of the tool arguments, generated once per tool."""
+        if self._json_schema is None:
+            try:
+                self._json_schema = self.args_schema.model_json_schema()
+            except Exception:
+                self._json_schema = self.args_schema
+        return self._json_schema
+
     def openai_schema(self) -> dict:
         """Return OpenAI-compatible function/tool schema."""
         return {
             "name": self.name,
             "description": self.description,
-            "parameters": self.args_schema.model_json_schema()
+            "parameters": self.json_schema()
         }
 
-    async def ainvoke(self, args: dict[str, Any]) -> Any:
-        return await self.coroutine(**args)
-
     async def call(self, args: dict[str, Any]) -> Any:
-        return await self.coroutine(**args)
+        fn = self.coroutine
+        if inspect.iscoroutinefunction(fn) or inspect.iscoroutinefunction(getattr(fn, "__call__", None)):
+            return await fn(**args)
+        # Plain functions run in a worker thread so they don't block the event loop.
+        result = await asyncio.to_thread(fn, **args)
+        # Async callables that don't look like one (e.g. behind an unwrapped decorator) return an awaitable.
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    ainvoke = call
 
 
 def convert_mcp_tool_to_simple_tool(
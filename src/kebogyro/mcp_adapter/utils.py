@@ -1,15 +1,11 @@
-import collections
 import inspect
 import logging
-import types
 import hashlib
 import uuid
-from contextlib import suppress
-from typing import Annotated, Any, Callable, Literal, Optional, Union, cast, List, Dict
+from typing import Any, Callable, Literal, Optional, Union, List, Dict
 
 from pydantic import BaseModel
-from pydantic.v1 import BaseModel as BaseModelV1
-from typing_extensions import TypedDict, get_args, get_origin, is_typeddict
+from typing_extensions import TypedDict
 from .tools import SimpleTool
 from .sessions import Connection
 import json
@@ -142,16 +138,12 @@ def tool_example_to_messages(input: str, tool_calls: list[BaseModel], tool_outpu
 def convert_tools_to_openai_format(tools: List[SimpleTool]) -> List[Dict[str, Any]]:
     openai_tools = []
     for tool in tools:
-        try:
-            schema = tool.args_schema.model_json_schema()
-        except:
-            schema = tool.args_schema
         openai_tools.append({
             "type": "function",  
             "function": {     
                 "name": tool.name,
                 "description": tool.description,
-                "parameters": schema,  
+                "parameters": tool.json_schema(),  
             }
         })
     return openai_tools
@@ -1,6 +1,8 @@
 from typing import Dict, Any, List, Union, AsyncGenerator, Tuple, Optional, Callable
 
 class HumanMessage:
+    __slots__ = ("content", "role")
+
     def __init__(self, content: Union[str, List[Dict[str, Any]]], role: str = "user"):
         self.content = content
         self.role = role
@@ -12,6 +14,8 @@ class HumanMessage:
         return getattr(self, key, default)
 
 class AIMessageChunk:
+    __slots__ = ("content", "reasoning", "status", "name")
+
     def __init__(self, content: str, reasoning: Optional[str] = None, status: Optional[str] = None, name: Optional[str] = None):
         self.content = content
         self.reasoning = reasoning
@@ -19,6 +23,8 @@ class AIMessageChunk:
         self.name = name
 
 class AIMessage: 
+    __slots__ = ("content", "tool_calls", "role")
+
     def __init__(self, content: str, tool_calls: Optional[List[Dict[str, Any]]] = None):
         self.content = content
         self.tool_calls = tool_calls or []
@@ -31,6 +37,8 @@ class AIMessage:
         return msg_dict
 
 class ToolMessage: 
+    __slots__ = ("content", "tool_call_id", "role")
+
     def __init__(self, content: str, tool_call_id: str):
         self.content = content
         self.tool_call_id = tool_call_id
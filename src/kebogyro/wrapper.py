@@ -15,14 +15,16 @@ from openai.types.chat import (
 )
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from openai.types import FunctionDefinition as OpenAIFunctionDefinition
+import asyncio
 import json 
 import logging 
 import uuid
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
 class LLMClientWrapper:
+    TOOL_CACHE_EXPIRATION_SECONDS = 60 * 60 * 24
+
     def __init__(self, provider: str, 
         model_name: str, 
         model_info: Dict[str, Any],         
@@ -30,7 +32,8 @@ class LLMClientWrapper:
         additional_tools: Optional[List[SimpleTool]] = None, 
         system_prompt: Optional[str] = None, 
         cache_key: str = "global_tools_cache",
-        llm_cache: Optional[AbstractLLMCache] = None):
+        llm_cache: Optional[AbstractLLMCache] = None,
+        parallel_tool_calls: bool = False):
 
         self.logger = logging.getLogger(f"LLMClientWrapper.{model_name}")
         self.provider = provider
@@ -45,8 +48,8 @@ class LLMClientWrapper:
         self._raw_available_tools_from_mcp: Dict[str, SimpleTool] = {}
         self.available_tools_for_llm: List[ChatCompletionToolParam] = []
         self.cache_key = cache_key
-        self.TOOL_CACHE_EXPIRATION_SECONDS = 60 * 60 * 24
         self.llm_cache = llm_cache
+        self.parallel_tool_calls = parallel_tool_calls
 
         if self.llm_cache is None:
             self.logger.warning("No LLM Cache implementation provided. Tool caching will be disabled.")
@@ -56,40 +59,54 @@ class LLMClientWrapper:
 
         self.temperature = self.model_info.get("temperature", 0.0)
 
-        self.logger.info(f"LLMClientWrapper Initializing: Provider={self.provider}, Model={self.model_name}, Base_URL={base_url}, Temp={self.temperature}")
+        self.logger.info("LLMClientWrapper Initializing: Provider=%s, Model=%s, Base_URL=%s, Temp=%s", self.provider, self.model_name, base_url, self.temperature)
 
+        client_kwargs: Dict[str, Any] = {"api_key": self.model_info["api_key"]}
         if base_url:
-            return AsyncOpenAI(api_key=self.model_info["api_key"], base_url=base_url)
-        else:
-            return AsyncOpenAI(api_key=self.model_info["api_key"])
+            client_kwargs["base_url"] = base_url
+        # A caller-owned httpx.AsyncClient lets many wrappers share one keep-alive pool.
+        if self.model_info.get("http_client") is not None:
+            client_kwargs["http_client"] = self.model_info["http_client"]
+
+        return AsyncOpenAI(**client_kwargs)
+
+    async def _fetch_live_tools(self, server_name: Optional[str]) -> List[SimpleTool]:
+        live_tools = list(self.additional_tools or [])
+        if self.mcp_client:
+            live_tools += await self.mcp_client.get_tools(server_name=server_name)
+        self._raw_available_tools_from_mcp = {tool.name: tool for tool in live_tools}
+        return live_tools
 
     async def load_tools(self, server_name: str = None, force_refresh: bool = False) -> List[ChatCompletionToolParam]:
         cached_tools_data = None
+
+        if not self.additional_tools and not self.mcp_client:
+            # Nothing to resolve cached entries against, so skip the cache round-trips entirely.
+            self._raw_available_tools_from_mcp = {}
+            self.available_tools_for_llm = []
+            return self.available_tools_for_llm
         
-        self.logger.info(f"Attempting to load tools. Cache key: {self.cache_key}, Force Refresh: {force_refresh}")
+        self.logger.info("Attempting to load tools. Cache key: %s, Force Refresh: %s", self.cache_key, force_refresh)
 
         if self.llm_cache and not force_refresh:
             try:
                 cached_tools_data = await self.llm_cache.aget_value(self.cache_key)
                 if cached_tools_data and not await self.llm_cache.is_expired(self.cache_key, self.TOOL_CACHE_EXPIRATION_SECONDS):
-                    self.logger.info(f"Using cached tools for key: {self.cache_key}.")
+                    self.logger.info("Using cached tools for key: %s.", self.cache_key)
                 else:
-                    self.logger.info(f"Cache expired or invalid for key: {self.cache_key}. Refreshing.")
+                    self.logger.info("Cache expired or invalid for key: %s. Refreshing.", self.cache_key)
                     cached_tools_data = None 
             except Exception as e:
-                self.logger.error(f"Error accessing cache for key {self.cache_key}: {e}", exc_info=True)
+                self.logger.error("Error accessing cache for key %s: %s", self.cache_key, e, exc_info=True)
                 if self.llm_cache:
                     await self.llm_cache.adelete_value(self.cache_key) 
-                self.logger.warning(f"Malformed/errored cache entry deleted for key: {self.cache_key}.")
+                self.logger.warning("Malformed/errored cache entry deleted for key: %s.", self.cache_key)
                 cached_tools_data = None
 
         if cached_tools_data:
             self.logger.debug("Populating _raw_available_tools_from_mcp for deserialization (if not already).")
             if not self._raw_available_tools_from_mcp: 
-                live_tools = self.additional_tools
-                if self.mcp_client:
-                    live_tools += await self.mcp_client.get_tools(server_name=server_name)
-                self._raw_available_tools_from_mcp = {tool.name: tool for tool in live_tools}
+                await self._fetch_live_tools(server_name)
             
             deserialized_tools = []
             for tool_data in cached_tools_data:
@@ -97,31 +114,21 @@ class LLMClientWrapper:
                 if tool_name and tool_name in self._raw_available_tools_from_mcp:
                     deserialized_tools.append(self._raw_available_tools_from_mcp[tool_name])
                 else:
-                    self.logger.warning(f"Live tool '{tool_name}' not found for cached entry. Skipping.")
+                    self.logger.warning("Live tool '%s' not found for cached entry. Skipping.", tool_name)
 
             self.available_tools_for_llm = convert_tools_to_openai_format(deserialized_tools)
-            self.logger.info(f"Loaded {len(self.available_tools_for_llm)} tools from cache for LLM.")
+            self.logger.info("Loaded %s tools from cache for LLM.", len(self.available_tools_for_llm))
             return self.available_tools_for_llm
 
         self.logger.info("Fetching tools from MCP and updating cache.")
         try:
-            live_tools = self.additional_tools
-            if self.mcp_client:
-                live_tools += await self.mcp_client.get_tools(server_name=server_name)
-            self._raw_available_tools_from_mcp = {tool.name: tool for tool in live_tools}
-
-            serialized_tools = []
-            for tool in live_tools:
-                try:
-                    schema = tool.args_schema.model_json_schema()
-                except Exception:
-                    schema = tool.args_schema
-                serialized_tools.append({
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": schema,
-                    "metadata": tool.metadata,
-                })
+            live_tools = await self._fetch_live_tools(server_name)
+
+            openai_tools = convert_tools_to_openai_format(live_tools)
+            serialized_tools = [
+                {**openai_tool["function"], "metadata": tool.metadata}
+                for tool, openai_tool in zip(live_tools, openai_tools)
+            ]
 
             if self.llm_cache:
                 await self.llm_cache.aset_value(
@@ -129,25 +136,48 @@ class LLMClientWrapper:
                     serialized_tools, 
                     self.TOOL_CACHE_EXPIRATION_SECONDS
                 )
-                self.logger.info(f"Tools fetched from MCP and saved to cache for key: {self.cache_key}.")
+                self.logger.info("Tools fetched from MCP and saved to cache for key: %s.", self.cache_key)
             else:
                 self.logger.info("Tools fetched from MCP but caching is disabled.")
 
 
-            self.available_tools_for_llm = convert_tools_to_openai_format(live_tools)
-            self.logger.info(f"Prepared {len(self.available_tools_for_llm)} tools for LLM after MCP fetch.")
+            self.available_tools_for_llm = openai_tools
+            self.logger.info("Prepared %s tools for LLM after MCP fetch.", len(self.available_tools_for_llm))
             return self.available_tools_for_llm
 
         except Exception as e:
-            self.logger.error(f"Failed to fetch or cache tools from MCP: {e}", exc_info=True)
+            self.logger.error("Failed to fetch or cache tools from MCP: %s", e, exc_info=True)
             self.available_tools_for_llm = []
             return []
 
     def _get_openai_tools_format(self) -> List[ChatCompletionToolParam]:
         return self.available_tools_for_llm
 
+    async def _execute_tool_call(self, tool_name: str, tool_arguments: Dict[str, Any]) -> Tuple[str, bool]:
+        tool_to_execute = self._raw_available_tools_from_mcp.get(tool_name)
+
+        if not tool_to_execute:
+            error_content = f"Error: Tool '{tool_name}' not found. Ensure tool is correctly loaded in MCP."
+            self.logger.error(error_content)
+            return error_content, True
+
+        self.logger.info("Executing tool: %s with args: %s", tool_name, tool_arguments)
+        try:
+            raw_tool_output = await tool_to_execute.call(tool_arguments)
+        except Exception as tool_e:
+            self.logger.error("Error during tool execution for %s: %s", tool_name, tool_e, exc_info=True)
+            return f"Error executing tool '{tool_name}': {tool_e}", True
+
+        if isinstance(raw_tool_output, tuple) and len(raw_tool_output) > 0:
+            tool_full_output_content = str(raw_tool_output[0])
+        else:
+            tool_full_output_content = str(raw_tool_output)
+
+        self.logger.debug("Tool '%s' output (first 200 chars): %.200s...", tool_name, tool_full_output_content)
+        return tool_full_output_content, False
+
     async def chat_completion_with_tools(self, user_message_content: str, stream: bool = True) -> AsyncGenerator[Tuple[str, Any], None]:
-        self.logger.debug(f"Current conversation history: {self.conversation_history}")
+        self.logger.debug("Current conversation history: %s", self.conversation_history)
 
         if self.system_prompt_content:
             if not any(msg.get("role") == "system" for msg in self.conversation_history if isinstance(msg, dict)):
@@ -163,8 +193,8 @@ class LLMClientWrapper:
         else:
             self.logger.debug("User message already present or identical, skipping append.")
 
-        self.logger.debug(f"System Prompt: {self.system_prompt_content}")
-        self.logger.debug(f"Messages to send to LLM: {self.conversation_history}")
+        self.logger.debug("System Prompt: %s", self.system_prompt_content)
+        self.logger.debug("Messages to send to LLM: %s", self.conversation_history)
 
         iteration_count = 0
         max_iterations = 15
@@ -173,55 +203,60 @@ class LLMClientWrapper:
             await self.load_tools()
             self.logger.info("Tools loaded for the first time in this session.")
 
+        # The tool set is fixed for the whole tool-calling loop.
+        tools_for_llm = self._get_openai_tools_format() or NOT_GIVEN
+        # Without tools, omit tool_choice too; some providers reject it on its own.
+        tool_choice = "auto" if tools_for_llm is not NOT_GIVEN else NOT_GIVEN
+
         while iteration_count < max_iterations:
             iteration_count += 1
-            self.logger.info(f"LLM Chat Completion Loop Iteration: {iteration_count}")
+            self.logger.info("LLM Chat Completion Loop Iteration: %s", iteration_count)
 
-            tools_for_llm = self._get_openai_tools_format()
-            
             try:
                 response_stream = await self.client.chat.completions.create(
                     model=self.model_name,
                     messages=self.conversation_history,
-                    tools=tools_for_llm if tools_for_llm else NOT_GIVEN,
-                    tool_choice="auto",
+                    tools=tools_for_llm,
+                    tool_choice=tool_choice,
                     stream=True,
                     temperature=self.temperature
                 )
 
-                accumulated_assistant_content = ""
+                assistant_content_parts: List[str] = []
                 accumulated_tool_calls_raw: List[Dict[str, Any]] = []
-                accumulated_reasoning = ""
-                has_tool_calls_in_current_response = False
-                has_content_in_current_response = False
+                # Bound once: the append runs for nearly every streamed chunk.
+                append_content = assistant_content_parts.append
 
                 async for chunk in response_stream:
                     if stream:
                         yield ("chunk", chunk)
 
+                    # Usage/keep-alive chunks carry no choices; nothing to accumulate.
+                    if not chunk.choices:
+                        continue
+
                     delta = chunk.choices[0].delta
+                    content = delta.content
+                    reasoning = getattr(delta, "reasoning", None)
+                    tool_call_deltas = delta.tool_calls
 
-                    if delta.content:
-                        accumulated_assistant_content += delta.content
-                        has_content_in_current_response = True
+                    if content:
+                        append_content(content)
                         if stream:
-                            yield ("messages", (AIMessageChunk(content=delta.content), {}))
+                            yield ("messages", (AIMessageChunk(content=content), {}))
 
-                    if hasattr(delta, "reasoning") and delta.reasoning:
-                        accumulated_reasoning += delta.reasoning
-                        if stream:
-                            yield ("reasoning_chunk", AIMessageChunk(content="", reasoning=delta.reasoning))
+                    if reasoning and stream:
+                        yield ("reasoning_chunk", AIMessageChunk(content="", reasoning=reasoning))
 
-                    if delta.tool_calls:
-                        has_tool_calls_in_current_response = True
-                        for new_tool_call_obj in delta.tool_calls:
+                    if tool_call_deltas:
+                        for new_tool_call_obj in tool_call_deltas:
                             index = new_tool_call_obj.index
 
                             while len(accumulated_tool_calls_raw) <= index:
                                 accumulated_tool_calls_raw.append({
-                                    "id": f"call_{uuid.uuid4().hex}",
+                                    "id": None,
                                     "type": "function",
-                                    "function": {"name": "", "arguments": ""}
+                                    "function": {"name": "", "arguments": []}
                                 })
 
                             current_tool_call = accumulated_tool_calls_raw[index]
@@ -235,15 +270,37 @@ class LLMClientWrapper:
                                 if new_tool_call_obj.function.name:
                                     current_tool_call["function"]["name"] = new_tool_call_obj.function.name
                                 if new_tool_call_obj.function.arguments:
-                                    current_tool_call["function"]["arguments"] += new_tool_call_obj.function.arguments
+                                    current_tool_call["function"]["arguments"].append(new_tool_call_obj.function.arguments)
+
+                accumulated_assistant_content = "".join(assistant_content_parts)
 
                 final_tool_calls_list: List[ChatCompletionMessageToolCall] = []
+                parsed_tool_arguments: List[Any] = []
                 for tc_dict in accumulated_tool_calls_raw:
-                    try:
-                        json.loads(tc_dict["function"]["arguments"])
-                    except json.JSONDecodeError:
-                        self.logger.warning(f"Malformed JSON arguments from LLM for tool call '{tc_dict.get('id', 'N/A')}': {tc_dict['function']['arguments']}. Defaulting to empty object string.", exc_info=True)
+                    if not tc_dict["id"]:
+                        # Only mint an id when the provider never streamed one.
+                        tc_dict["id"] = f"call_{uuid.uuid4().hex}"
+                    # Argument fragments are collected in a list during the stream and joined once here.
+                    raw_arguments = "".join(tc_dict["function"]["arguments"])
+                    tc_dict["function"]["arguments"] = raw_arguments
+                    arguments_str = raw_arguments.lstrip()
+                    tool_arguments = None
+                    if not arguments_str:
+                        # Argument-less calls often stream no argument fragments at all.
+                        tool_arguments = {}
+                    elif arguments_str[0] == "{":
+                        # Only a JSON object can be passed as keyword arguments; skip parsing anything else.
+                        try:
+                            tool_arguments = json.loads(arguments_str)
+                        except json.JSONDecodeError:
+                            pass
+
+                    if tool_arguments is None:
+                        self.logger.warning("Malformed JSON arguments from LLM for tool call '%s': %s. Defaulting to empty object string.", tc_dict.get('id', 'N/A'), raw_arguments)
+                        tool_arguments = {}
+                    if not tool_arguments:
                         tc_dict["function"]["arguments"] = "{}"
+                    parsed_tool_arguments.append(tool_arguments)
 
                     final_tool_calls_list.append(
                         ChatCompletionMessageToolCall(
@@ -263,80 +320,44 @@ class LLMClientWrapper:
                 )
 
                 self.conversation_history.append(full_response_message)
-                self.logger.debug(f"Appended assistant message to history: {full_response_message}")
+                self.logger.debug("Appended assistant message to history: %s", full_response_message)
 
                 tool_calls_from_response = full_response_message.get("tool_calls")
 
                 if tool_calls_from_response:
                     tool_outputs_messages: List[ChatCompletionToolMessageParam] = []
-                    self.logger.info(f"LLM requested tool calls: {tool_calls_from_response}")
-
-                    for tool_call in tool_calls_from_response:
-                        tool_name = tool_call.function.name
-                        tool_args_str = tool_call.function.arguments
-                        tool_call_id = tool_call.id
-
-                        try:
-                            tool_arguments = json.loads(tool_args_str)
-                        except json.JSONDecodeError as e:
-                            self.logger.error(f"Malformed JSON arguments for tool '{tool_name}': {tool_args_str}. Error: {e}", exc_info=True)
-                            error_content = f"Error: Malformed JSON arguments for tool '{tool_name}'. Arguments must be valid JSON."
-                            tool_outputs_messages.append(
-                                ChatCompletionToolMessageParam(
-                                    role="tool",
-                                    tool_call_id=tool_call_id,
-                                    content=error_content
-                                )
-                            )
-                            if stream:
-                                yield ("tool_output_chunk_error", AIMessageChunk(content=error_content, status="error", name=tool_name))
-                            continue
-
-                        tool_to_execute = next((t for t in self._raw_available_tools_from_mcp.values() if t.name == tool_name), None)
-
-                        if tool_to_execute:
-                            self.logger.info(f"Executing tool: {tool_name} with args: {tool_arguments}")
-                            tool_full_output_content = ""
-                            try:
-                                raw_tool_output = await tool_to_execute.call(tool_arguments)
-                                
-                                if isinstance(raw_tool_output, tuple) and len(raw_tool_output) > 0:
-                                    tool_full_output_content = str(raw_tool_output[0])
-                                else:
-                                    tool_full_output_content = str(raw_tool_output)
-                                
-                                self.logger.debug(f"Tool '{tool_name}' output (first 200 chars): {tool_full_output_content[:200]}...")
-                                if stream:
-                                    yield ("tool_output_chunk", AIMessageChunk(content=tool_full_output_content, name=tool_name))
-
-                            except Exception as tool_e:
-                                self.logger.error(f"Error during tool execution for {tool_name}: {tool_e}", exc_info=True)
-                                tool_full_output_content = f"Error executing tool '{tool_name}': {tool_e}"
-                                if stream:
-                                    yield ("tool_output_chunk_error", AIMessageChunk(content=tool_full_output_content, status="error", name=tool_name))
-                            
-                            tool_outputs_messages.append(
-                                ChatCompletionToolMessageParam(
-                                    role="tool",
-                                    tool_call_id=tool_call_id,
-                                    content=tool_full_output_content
-                                )
-                            )
+                    self.logger.info("LLM requested tool calls: %s", tool_calls_from_response)
+
+                    # Arguments were already parsed once while validating the streamed calls.
+                    tool_calls_with_arguments = list(zip(tool_calls_from_response, parsed_tool_arguments))
+                    gathered_results = None
+                    if self.parallel_tool_calls:
+                        # Opt-in: only safe when the model's calls don't depend on each other.
+                        gathered_results = await asyncio.gather(*(
+                            self._execute_tool_call(tool_call.function.name, tool_arguments)
+                            for tool_call, tool_arguments in tool_calls_with_arguments
+                        ))
+
+                    for position, (tool_call, tool_arguments) in enumerate(tool_calls_with_arguments):
+                        if gathered_results is None:
+                            tool_output_content, is_error = await self._execute_tool_call(tool_call.function.name, tool_arguments)
                         else:
-                            error_content = f"Error: Tool '{tool_name}' not found. Ensure tool is correctly loaded in MCP."
-                            self.logger.error(error_content)
-                            tool_outputs_messages.append(
-                                ChatCompletionToolMessageParam(
-                                    role="tool",
-                                    tool_call_id=tool_call_id,
-                                    content=error_content
-                                )
+                            tool_output_content, is_error = gathered_results[position]
+                        tool_outputs_messages.append(
+                            ChatCompletionToolMessageParam(
+                                role="tool",
+                                tool_call_id=tool_call.id,
+                                content=tool_output_content
                             )
-                            if stream:
-                                yield ("tool_output_chunk_error", AIMessageChunk(content=error_content, status="error", name=tool_name))
+                        )
+                        if stream:
+                            if is_error:
+                                yield ("tool_output_chunk_error", AIMessageChunk(content=tool_output_content, status="error", name=tool_call.function.name))
+                            else:
+                                yield ("tool_output_chunk", AIMessageChunk(content=tool_output_content, name=tool_call.function.name))
 
                     self.conversation_history.extend(tool_outputs_messages)
-                    self.logger.debug(f"Appended tool outputs to history. Current history length: {len(self.conversation_history)}")
+                    self.logger.debug("Appended tool outputs to history. Current history length: %s", len(self.conversation_history))
 
                 else:
                     if accumulated_assistant_content:
@@ -347,10 +368,10 @@ class LLMClientWrapper:
                         self.logger.warning("LLM response had no tool calls and no content. Continuing loop, model might be stuck.")
 
             except Exception as e:
-                self.logger.error(f"Critical Error during LLMClientWrapper chat completion: {e}", exc_info=True)
+                self.logger.error("Critical Error during LLMClientWrapper chat completion: %s", e, exc_info=True)
                 yield ("error", str(e))
                 break
 
         if iteration_count >= max_iterations:
-            self.logger.warning(f"LLMClientWrapper recursion limit ({max_iterations}) reached without a final answer.")
+            self.logger.warning("LLMClientWrapper recursion limit (%s) reached without a final answer.", max_iterations)
             yield ("error", f"Recursion limit reached without a final answer. Max iterations: {max_iterations}. Please refine your prompt or tools.")
@@ -2,6 +2,7 @@ import pytest
 from kebogyro.wrapper import LLMClientWrapper
 from kebogyro.agent_executor import create_agent
 from kebogyro.mcp_adapter.tools import SimpleTool
+from kebogyro.messages import AIMessageChunk
 
 @pytest.mark.asyncio
 async def test_create_agent_runs():
@@ -26,3 +27,30 @@ async def test_create_agent_runs():
 
     assert agent.llm_client == llm
     assert agent.system_prompt == "Act as a multiplier"
+
+
+@pytest.mark.asyncio
+async def test_agent_astream_forwards_message_chunks():
+    llm = LLMClientWrapper(
+        provider="openrouter",
+        model_name="mistralai/mistral-7b-instruct",
+        model_info={"api_key": "test-key"}
+    )
+
+    async def fake_stream(user_message_content, stream=True):
+        yield ("messages", (AIMessageChunk(content="Hi"), {}))
+        yield ("reasoning_chunk", AIMessageChunk(content="", reasoning="thinking"))
+        yield ("tool_output_chunk", AIMessageChunk(content="42", name="doubler"))
+        yield ("values", [])
+
+    llm.chat_completion_with_tools = fake_stream
+    agent = create_agent(llm_client=llm, tools=None, mcp_tools=None, system_prompt="", stream=True)
+
+    events = [
+        event async for event in agent.astream(
+            {"messages": [{"role": "user", "content": "Hello"}]}, stream_mode=["messages"], config={}
+        )
+    ]
+
+    assert [kind for kind, _ in events] == ["messages", "messages", "messages"]
+    assert [data[0].content for _, data in events] == ["Hi", "", "42"]
@@ -0,0 +1,8 @@
+from kebogyro import config
+from kebogyro.config import get_base_url
+
+
+def test_get_base_url_sees_providers_registered_at_runtime(monkeypatch):
+    assert get_base_url(provider="my_custom") is None
+    monkeypatch.setitem(config._llm_config.base_urls, "my_custom", "https://llm.example.com/v1")
+    assert get_base_url(provider="my_custom") == "https://llm.example.com/v1"
@@ -1,3 +1,7 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+import pytest
 from kebogyro.mcp_adapter.client import BBServerMCPClient
 from kebogyro.cache import AbstractLLMCache
 
@@ -18,3 +22,69 @@ def test_mcp_client_instantiation():
         cache_adapter=DummyCache()
     )
     assert "bridge" in client.connections
+
+
+@pytest.mark.asyncio
+async def test_mcp_client_limits_concurrent_connections():
+    client = BBServerMCPClient(
+        connections={
+            name: {"url": f"http://localhost:8000/{name}/sse", "transport": "sse"}
+            for name in ("a", "b", "c")
+        },
+        max_concurrent_connections=1,
+    )
+    open_sessions = []
+    peak = 0
+
+    class FakeSession:
+        async def list_tools(self, cursor=None):
+            await asyncio.sleep(0)
+            return SimpleNamespace(tools=[], nextCursor=None)
+
+    @asynccontextmanager
+    async def fake_session(server_name):
+        nonlocal peak
+        open_sessions.append(server_name)
+        peak = max(peak, len(open_sessions))
+        yield FakeSession()
+        open_sessions.remove(server_name)
+
+    client.session = fake_session
+
+    assert await client.get_tools() == []
+    assert peak == 1
+
+
+def test_mcp_client_tool_cache_key_follows_connection_changes():
+    client = BBServerMCPClient(
+        connections={"bridge": {"url": "http://localhost:8000/bridge/sse", "transport": "sse"}}
+    )
+    first_key = client._tool_cache_key(None)
+    client.connections["other"] = {"url": "http://localhost:8000/other/sse", "transport": "sse"}
+    assert client._tool_cache_key(None) != first_key
+
+
+@pytest.mark.parametrize("limit", [0, -1, 1.5, True])
+def test_mcp_client_rejects_invalid_connection_limit(limit):
+    with pytest.raises(ValueError, match="max_concurrent_connections"):
+        BBServerMCPClient(connections={}, max_concurrent_connections=limit)
+
+
+@pytest.mark.asyncio
+async def test_mcp_client_get_resources_forwards_concurrency_cap(monkeypatch):
+    client = BBServerMCPClient(connections={})
+    received = {}
+
+    @asynccontextmanager
+    async def fake_session(server_name):
+        yield SimpleNamespace()
+
+    async def fake_load(session, *, uris=None, max_concurrency):
+        received.update(uris=uris, max_concurrency=max_concurrency)
+        return []
+
+    client.session = fake_session
+    monkeypatch.setattr("kebogyro.mcp_adapter.client.load_mcp_resources", fake_load)
+
+    assert await client.get_resources("bridge", uris=["a"], max_concurrency=2) == []
+    assert received == {"uris": ["a"], "max_concurrency": 2}
@@ -0,0 +1,82 @@
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import pytest
+from mcp.types import TextResourceContents
+
+from kebogyro.mcp_adapter.resources import load_mcp_resources
+
+
+class FakeSession:
+    def __init__(self, delays, fail=()):
+        self.delays = delays
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.cancelled = []
+
+    async def list_resources(self):
+        return SimpleNamespace(resources=[SimpleNamespace(uri=uri) for uri in self.delays])
+
+    async def read_resource(self, uri):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays[uri])
+            if uri in self.fail:
+                raise ValueError(uri)
+            text = TextResourceContents(uri=f"file:///{uri}", mimeType="text/plain", text=uri)
+            return SimpleNamespace(contents=[text])
+        except asyncio.CancelledError:
+            self.cancelled.append(uri)
+            raise
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_load_mcp_resources_keeps_uri_order():
+    session = FakeSession({"slow": 0.02, "fast": 0})
+    blobs = await load_mcp_resources(session)
+    assert [blob.data for blob in blobs] == [b"slow", b"fast"]
+
+
+@pytest.mark.asyncio
+async def test_load_mcp_resources_caps_concurrent_reads():
+    session = FakeSession({f"r{i}": 0.01 for i in range(5)})
+    blobs = await load_mcp_resources(session, max_concurrency=2)
+    assert len(blobs) == 5
+    assert session.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_load_mcp_resources_cancels_siblings_on_failure():
+    session = FakeSession({"bad": 0, "slow": 1}, fail=["bad"])
+    with pytest.raises(RuntimeError, match="Error fetching resource bad") as exc_info:
+        await load_mcp_resources(session)
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    assert session.cancelled == ["slow"]
+    assert session.active == 0
+
+
+@pytest.mark.asyncio
+async def test_load_mcp_resources_retrieves_every_failure():
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+    try:
+        session = FakeSession({"a": 0, "b": 0, "c": 0}, fail=["a", "b", "c"])
+        with pytest.raises(RuntimeError, match="Error fetching resource a"):
+            await load_mcp_resources(session)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -1, 1.5, True])
+async def test_load_mcp_resources_rejects_invalid_concurrency(limit):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await load_mcp_resources(FakeSession({}), max_concurrency=limit)
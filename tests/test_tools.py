@@ -1,3 +1,7 @@
+import threading
+
+import pytest
+
 from kebogyro.mcp_adapter.tools import SimpleTool
 
 def echo(value: str) -> str:
@@ -13,3 +17,42 @@ def test_simpletool_schema():
     assert schema["name"] == "echo"
     assert "parameters" in schema
     assert schema["parameters"]["type"] == "object"
+
+
+def test_simpletool_schema_is_generated_once():
+    tool = SimpleTool.from_fn(name="echo", description="Echo the input value.", fn=echo)
+    assert tool.openai_schema()["parameters"] is tool.openai_schema()["parameters"]
+
+
+@pytest.mark.asyncio
+async def test_simpletool_runs_sync_fn_off_the_event_loop():
+    loop_thread = threading.get_ident()
+
+    def whoami(value: str) -> tuple[str, int]:
+        return value, threading.get_ident()
+
+    tool = SimpleTool.from_fn(name="whoami", description="Report the calling thread.", fn=whoami)
+    value, thread_id = await tool.call({"value": "hi"})
+    assert value == "hi"
+    assert thread_id != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_simpletool_awaits_async_callables():
+    class Shout:
+        async def __call__(self, value: str) -> str:
+            return value.upper()
+
+    def undecorated(fn):
+        def wrapper(value: str):
+            return fn(value)
+        return wrapper
+
+    @undecorated
+    async def whisper(value: str) -> str:
+        return value.lower()
+
+    shout = SimpleTool.from_fn(name="shout", description="Upper-case the value.", fn=Shout())
+    quiet = SimpleTool.from_fn(name="whisper", description="Lower-case the value.", fn=whisper)
+    assert await shout.call({"value": "hi"}) == "HI"
+    assert await quiet.ainvoke({"value": "HI"}) == "hi"
@@ -1,5 +1,11 @@
+import asyncio
+import httpx
 import pytest
+from types import SimpleNamespace
+from openai import NOT_GIVEN
+from kebogyro.cache import AbstractLLMCache
 from kebogyro.wrapper import LLMClientWrapper
+from kebogyro.mcp_adapter.tools import SimpleTool
 
 @pytest.mark.asyncio
 async def test_llm_wrapper_basic_init():
@@ -10,3 +16,199 @@ async def test_llm_wrapper_basic_init():
     )
     assert llm.model_name == "mistralai/mistral-7b-instruct"
     assert llm.provider == "openrouter"
+
+
+@pytest.mark.asyncio
+async def test_llm_wrapper_reuses_provided_http_client():
+    http_client = httpx.AsyncClient()
+    llm = LLMClientWrapper(
+        provider="openrouter",
+        model_name="mistralai/mistral-7b-instruct",
+        model_info={"api_key": "sk-test", "http_client": http_client}
+    )
+    assert llm.client._client is http_client
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_llm_wrapper_without_tools_skips_tool_cache():
+    class RecordingCache(AbstractLLMCache):
+        def __init__(self):
+            self.calls = []
+        async def aget_value(self, key): self.calls.append("get")
+        async def aset_value(self, key, value, expiry_seconds): self.calls.append("set")
+        async def adelete_value(self, key): self.calls.append("delete")
+        async def is_expired(self, key, expiry_seconds): self.calls.append("is_expired")
+
+    cache = RecordingCache()
+    llm = LLMClientWrapper(
+        provider="openrouter",
+        model_name="mistralai/mistral-7b-instruct",
+        model_info={"api_key": "sk-test"},
+        llm_cache=cache
+    )
+    assert await llm.load_tools() == []
+    assert cache.calls == []
+
+
+def _chunk(content=None, tool_calls=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def _tool_call(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index,
+        id=id,
+        type="function" if id else None,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def _fake_completions(*responses):
+    pending = list(responses)
+
+    async def create(**kwargs):
+        create.calls.append(kwargs)
+
+        async def stream():
+            for chunk in pending.pop(0):
+                yield chunk
+        return stream()
+
+    create.calls = []
+    return create
+
+
+@pytest.mark.asyncio
+async def test_llm_wrapper_streams_plain_text():
+    llm = LLMClientWrapper(
+        provider="openrouter",
+        model_name="mistralai/mistral-7b-instruct",
+        model_info={"api_key": "sk-test"},
+        additional_tools=[]
+    )
+    llm.client.chat.completions.create = _fake_completions(
+        [_chunk("Hello "), _chunk("World"), _chunk("!"), SimpleNamespace(choices=[])]
+    )
+
+    events = [event async for event in llm.chat_completion_with_tools("Hi")]
+
+    streamed = "".join(data[0].content for kind, data in events if kind == "messages")
+    assert streamed == "Hello World!"
+    assert events[-1][0] == "values"
+    assert events[-1][1][-1]["content"] == "Hello World!"
+    request = llm.client.chat.completions.create.calls[0]
+    assert request["tools"] is NOT_GIVEN
+    assert request["tool_choice"] is NOT_GIVEN
+
+
+@pytest.mark.asyncio
+async def test_llm_wrapper_executes_streamed_tool_calls():
+    async def doubler(x: int) -> int:
+        return x * 2
+
+    async def ping() -> str:
+        return "pong"
+
+    llm = LLMClientWrapper(
+        provider="openrouter",
+        model_name="mistralai/mistral-7b-instruct",
+        model_info={"api_key": "sk-test"},
+        additional_tools=[
+            SimpleTool.from_fn("doubler", "Doubles a number", doubler),
+            SimpleTool.from_fn("ping", "Replies pong", ping),
+        ]
+    )
+    llm.client.chat.completions.create = _fake_completions(
+        [
+            _chunk(tool_calls=[_tool_call(0, id="call_a", name="doubler", arguments='{"x":')]),
+            _chunk(tool_calls=[_tool_call(0, arguments=" 21}")]),
+            _chunk(tool_calls=[_tool_call(1, name="ping", arguments="null")]),
+        ],
+        [_chunk("Done")],
+    )
+
+    events = [event async for event in llm.chat_completion_with_tools("Double 21")]
+
+    outputs = [data.content for kind, data in events if kind == "tool_output_chunk"]
+    assert outputs == ["42", "pong"]
+    assert llm.client.chat.completions.create.calls[0]["tool_choice"] == "auto"
+    assistant_call = llm.conversation_history[1]
+    assert [tc.function.arguments for tc in assistant_call["tool_calls"]] == ['{"x": 21}', "{}"]
+    assert assistant_call["tool_calls"][0].id == "call_a"
+    assert assistant_call["tool_calls"][1].id.startswith("call_")
+    assert llm.conversation_history[3]["tool_call_id"] == assistant_call["tool_calls"][1].id
+    assert events[-1][0] == "values"
+
+
+@pytest.mark.asyncio
+async def test_llm_wrapper_runs_tool_calls_concurrently_when_enabled():
+    started = []
+    both_started = asyncio.Event()
+
+    async def left() -> str:
+        started.append("left")
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return "L"
+
+    async def right() -> str:
+        started.append("right")
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return "R"
+
+    llm = LLMClientWrapper(
+        provider="openrouter",
+        model_name="mistralai/mistral-7b-instruct",
+        model_info={"api_key": "sk-test"},
+        additional_tools=[SimpleTool.from_fn("left", "", left), SimpleTool.from_fn("right", "", right)],
+        parallel_tool_calls=True
+    )
+    llm.client.chat.completions.create = _fake_completions(
+        [
+            _chunk(tool_calls=[_tool_call(0, id="call_l", name="left", arguments="{}")]),
+            _chunk(tool_calls=[_tool_call(1, id="call_r", name="right", arguments="{}")]),
+        ],
+        [_chunk("Done")],
+    )
+
+    events = [event async for event in llm.chat_completion_with_tools("Go")]
+
+    assert [data.content for kind, data in events if kind == "tool_output_chunk"] == ["L", "R"]
+
+
+@pytest.mark.asyncio
+async def test_llm_wrapper_runs_tool_calls_in_order_by_default():
+    log = []
+
+    async def create() -> str:
+        await asyncio.sleep(0.01)
+        log.append("created")
+        return "made"
+
+    async def write() -> str:
+        log.append("write saw " + ",".join(log))
+        return "written"
+
+    llm = LLMClientWrapper(
+        provider="openrouter",
+        model_name="mistralai/mistral-7b-instruct",
+        model_info={"api_key": "sk-test"},
+        additional_tools=[SimpleTool.from_fn("create", "", create), SimpleTool.from_fn("write", "", write)]
+    )
+    llm.client.chat.completions.create = _fake_completions(
+        [
+            _chunk(tool_calls=[_tool_call(0, id="call_c", name="create", arguments="{}")]),
+            _chunk(tool_calls=[_tool_call(1, id="call_w", name="write", arguments="{}")]),
+        ],
+        [_chunk("Done")],
+    )
+
+    events = [event async for event in llm.chat_completion_with_tools("Go")]
+
+    assert log == ["created", "write saw created"]
+    assert [data.content for kind, data in events if kind == "tool_output_chunk"] == ["made", "written"]